@@ -0,0 +1,56 @@
+"""
+Task data bundling script.
+
+Bundles the JSON files of every task in DATA_DIR into a single Feather file that load_task_data reads
+from (if USE_TASK_BUNDLE is True in the config), so scoring all the tasks doesn't have to open and parse
+every JSON file separately. Requires pyarrow.
+"""
+
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from util_helpers import TASK_BUNDLE_PATH, TASK_SPLITS, load_task_json
+from config import DATA_DIR
+
+def bundle_task_data():
+    """
+    Creates the task bundle at TASK_BUNDLE_PATH.
+
+    Each row of the bundle is one task, with the columns "task_name", "matrix_shapes", and "matrix_values".
+    The input and output matrices of every example (in the same order as load_task_data returns them) are
+    flattened and concatenated into "matrix_values" as bytes, and their (rows, columns) are listed one after
+    the other in "matrix_shapes".
+    """
+
+    with os.scandir(DATA_DIR) as data_dir_entries:
+        task_names = sorted([entry.name[:-5] for entry in data_dir_entries
+                             if entry.name.startswith("task") and entry.name.endswith(".json") and entry.is_file()])
+
+    columns = {"task_name": [], "matrix_shapes": [], "matrix_values": []}
+    for task_name in task_names:
+        task_json = load_task_json(task_name)
+
+        matrix_shapes = []
+        matrix_values = []
+        for split in TASK_SPLITS:
+            for example_i in task_json[split]:
+                for matrix in (example_i["input"], example_i["output"]):
+                    matrix = np.array(matrix, dtype=np.uint8)
+                    matrix_shapes.extend(matrix.shape)
+                    matrix_values.append(matrix.tobytes())
+
+        columns["task_name"].append(task_name)
+        columns["matrix_shapes"].append(matrix_shapes)
+        columns["matrix_values"].append(b"".join(matrix_values))
+
+    schema = pa.schema([("task_name", pa.string()), ("matrix_shapes", pa.list_(pa.uint8())), ("matrix_values", pa.binary())])
+
+    #left uncompressed so the bundle can be memory mapped when it's read.
+    feather.write_feather(pa.table(columns, schema=schema), TASK_BUNDLE_PATH, compression="uncompressed")
+    print(f"Bundled {len(task_names)} tasks into {TASK_BUNDLE_PATH}")
+
+if __name__ == "__main__":
+    bundle_task_data()
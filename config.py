@@ -4,8 +4,9 @@ Config file for paths, plot settings, etc.
 
 DATA_DIR = "./data"
 SOLUTION_DIR = "./task_solutions"
-SOLUTION_DIR_NAME = "task_solutions" #used by importlib to load solution functions.
 LOGS_DIR = "./logs"
+#load tasks from the bundle created by bundle_task_data.py (requires pyarrow) instead of the json files.
+USE_TASK_BUNDLE = False
 
 VISUALIZE_SINGLE_TASK_EXAMPLES = True
 COLOR_DICT = {
@@ -4,18 +4,21 @@ Scoring and logging script.
 Scores and logs the results of a single task or all tasks at once.
 """
 
-import glob
 import os
-import importlib
+import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple, Optional
 
 import numpy as np
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 
 from visualize_task import TaskVisualizer
-from util_helpers import load_task_data, parse_logging_args
-from config import (LOGS_DIR, SOLUTION_DIR, SOLUTION_DIR_NAME,
+from util_helpers import load_task_data, load_solution_module, parse_logging_args
+from config import (LOGS_DIR, SOLUTION_DIR,
                          VISUALIZE_SINGLE_TASK_EXAMPLES,
                          SOLUTION_FUNCTION_NAME,
                          SCORE_COLOR_THRESHOLD_1, SCORE_COLOR_THRESHOLD_2, SCORE_COLOR_THRESHOLD_3)
@@ -41,6 +44,13 @@ class TaskScorer:
 
         - Excel Log:
             - Lists each task with it's score and percent of examples that are correct.
+
+        If --fast is set, each solution is only tested until its first incorrect or crashed example. The scores
+        are the same, but the logs only list the examples tested up to that point and the percent correct of 
+        the tasks that stopped early is left empty. Failing tasks are also listed as incorrectly solved or 
+        crashed based on their first failing example only; e.g. a task whose first failing example is incorrect
+        is listed as incorrectly solved even if a later example would have crashed, so the "Incorrectly Solved"
+        and "Program Crashed" counts can differ from a run without --fast.
     
     A task is only considered correct if every example is correct; an example is correct if the expected 
     and obtained outputs are the same. Correct tasks receive a score of 
@@ -50,48 +60,66 @@ class TaskScorer:
         NUM_TASKS (int): Total number of tasks.
         MAX_TASK_SCORE (int): Maximum available score for a task.
         MAX_OVERALL_SCORE (int): The maximum score available for all tasks combined; i.e. NUM_TASKS*MAX_TASK_SCORE.
+        EXCEL_FILLS (list): Cell fills for the excel log, from the lowest (red) to the highest (green) band.
 
         task_num (str): The task number; set to 0 if `--all_tasks` is set.
         verbose_errors_flag (bool): Whether to display the errors for each example (if set to true) or to simply list out every example that crashed.
+        fast_flag (bool): Whether to stop testing a solution at its first incorrect or crashed example when scoring all tasks.
     """
 
     NUM_TASKS = 400
     MAX_TASK_SCORE = 2500
     MAX_OVERALL_SCORE = 1000000
+    EXCEL_FILLS = [PatternFill(fill_type="solid", start_color=color, end_color=color) for color in ("FF081B", "FE8015", "FDF709", "87E155")]
 
-    def __init__(self, task_num: str, verbose_errors_flag: bool):
+    def __init__(self, task_num: str, verbose_errors_flag: bool, fast_flag: bool=False):
         """
         Initializes an instance with the task to be process and the verbosity of the logs.
 
         Args:
             task_num (str): Task number; e.g. 1 for task001.
             verbose_errors_flag (bool): Specifies log error verbosity.
+            fast_flag (bool): Specifies if testing stops at a solution's first failing example when scoring all tasks.
         """
 
         self.task_num = task_num
         self.verbose_errors_flag = verbose_errors_flag
+        self.fast_flag = fast_flag
     
     #=====Main Logging Functions=====
             
     def _score_log_all_tasks(self):
         """
         Scores all tasks and creates logs for the results.
+
+        The attempted tasks are scored in parallel, each in a separate worker process.
         """
 
-        unattempted_tasks = [f"task{str(i).zfill(3)}" for i in range(1, self.NUM_TASKS+1)]
-        attempted_tasks = sorted([task_path[-10:-3] for task_path in glob.glob(os.path.join(SOLUTION_DIR, "task*.py"))])
+        all_tasks = [f"task{i:03d}" for i in range(1, self.NUM_TASKS+1)]
+        #if the solution directory doesn't exist yet, every task is unattempted.
+        attempted_tasks = []
+        if os.path.isdir(SOLUTION_DIR):
+            with os.scandir(SOLUTION_DIR) as solution_dir_entries:
+                attempted_tasks = sorted([entry.name[:-3] for entry in solution_dir_entries
+                                          if entry.name.startswith("task") and entry.name.endswith(".py") and entry.is_file()])
+        attempted_tasks_set = set(attempted_tasks)
+        unattempted_tasks = [task_name for task_name in all_tasks if task_name not in attempted_tasks_set]
         correct_tasks = []
         incorrect_tasks = []
         crashed_tasks = []
 
         logging_df_columns = ["Score", "Percent Correct", "Correct Examples", "Incorrect Examples", "Crashed Examples", "Crashed Example Errors"]
-        logging_df = pd.DataFrame(index=unattempted_tasks, columns=logging_df_columns)
+        logging_rows = []
+        logging_index = []
 
-        for task_name in attempted_tasks:
-            unattempted_tasks.remove(task_name)
+        #tasks are independent of each other, so they are scored in parallel across processes; each worker
+        #loads the data of its own tasks, so the file reads and parsing are spread across the processes too.
+        with ProcessPoolExecutor() as executor:
+            processed_tasks = list(executor.map(self._process_task_solution, attempted_tasks))
 
-            task_results_dict, _ = self._process_task_solution(task_name)
-            logging_df.loc[task_name] = task_results_dict
+        for task_name, (task_results_dict, _) in zip(attempted_tasks, processed_tasks):
+            logging_rows.append(task_results_dict)
+            logging_index.append(task_name)
 
             if task_results_dict["Score"]>0.001:
                 correct_tasks.append(task_name)
@@ -101,14 +129,18 @@ class TaskScorer:
                 crashed_tasks.append(task_name) 
         
         for task_name in unattempted_tasks:
-            logging_df.loc[task_name] = {
+            logging_rows.append({
                 "Score": 0.001,
                 "Percent Correct": 0,
                 "Correct Examples": [],
                 "Incorrect Examples": [],
                 "Crashed Examples": [],
                 "Crashed Example Errors": []
-            }
+            })
+            logging_index.append(task_name)
+
+        #built in one go; object dtype keeps integer scores as ints and sorting puts the tasks back in order.
+        logging_df = pd.DataFrame(logging_rows, index=logging_index, columns=logging_df_columns, dtype=object).sort_index()
         
         self._create_log(logging_df, correct_tasks, incorrect_tasks, crashed_tasks, unattempted_tasks)
         self._create_excel(logging_df, logging_df_columns)
@@ -129,17 +161,18 @@ class TaskScorer:
 
         self._create_single_log(task_name, task_results_dict)
 
-        print(f"====================VISUALIZATION====================")
         if VISUALIZE_SINGLE_TASK_EXAMPLES:
-            print("You have set VISUALIZE_SINGLE_TASK_EXAMPLES in the config file to True.")
-            print("Creating plot...")
+            sys.stdout.write(f"====================VISUALIZATION====================\n"
+                             "You have set VISUALIZE_SINGLE_TASK_EXAMPLES in the config file to True.\n"
+                             "Creating plot...\n")
             TV_i = TaskVisualizer(task_name, solution_results)
             TV_i.show()
             print("Plot closed.")
         
         else:
-            print("You have set VISUALIZE_SINGLE_TASK_EXAMPLES in the config file to False; as such a plot will not be created.")
-            print("If you would like to visualize the examples of this task, please set VISUALIZE_SINGLE_TASK_EXAMPLES to True in the config file.")
+            sys.stdout.write(f"====================VISUALIZATION====================\n"
+                             "You have set VISUALIZE_SINGLE_TASK_EXAMPLES in the config file to False; as such a plot will not be created.\n"
+                             "If you would like to visualize the examples of this task, please set VISUALIZE_SINGLE_TASK_EXAMPLES to True in the config file.\n")
     
     #=====Helper Functions=====
     
@@ -172,8 +205,7 @@ class TaskScorer:
             Tuple[int, Callable]: Tentative score and the main solution function.
         """
 
-        task_module = importlib.import_module(f"{SOLUTION_DIR_NAME}.{task_name}")
-        solution_size = os.path.getsize(os.path.join(SOLUTION_DIR,f"{task_name}.py"))
+        task_module, solution_size = load_solution_module(task_name)
         tentative_score = max(1, 2500-solution_size)
         main_solution_function = getattr(task_module, SOLUTION_FUNCTION_NAME)
 
@@ -207,7 +239,7 @@ class TaskScorer:
             }
 
             #dummy arrays for visualization
-            results = [(np.array(example_i["output"])*0).tolist() for example_i in task_data]
+            results = [self._zeros_like_nested(example_i["output"]) for example_i in task_data]
 
             return tested_solution_dict, results
 
@@ -219,14 +251,23 @@ class TaskScorer:
 
         results = []
 
+        #the task's score is already known to be 0.001 once an example fails, so (if --fast is set) the 
+        #remaining examples are skipped; solution outputs are only stored when every example is needed.
+        stop_at_first_failure = self.fast_flag and (not store_results)
+
         for i ,example_i in enumerate(task_data):
             example_input = example_i["input"]
             example_expected_output = example_i["output"]
 
+            #solutions often modify the matrix in place; when the results are stored (to visualize the task), 
+            #they get a copy so the cached task data shown in the plot stays intact.
+            if store_results:
+                example_input = [row[:] for row in example_input]
+
             try:
                 result = solution_function(example_input)
 
-                if np.array_equal(result, example_expected_output):
+                if self._outputs_match(result, example_expected_output):
                     correct_list.append(i)
                 else:
                     incorrect_list.append(i)
@@ -236,29 +277,76 @@ class TaskScorer:
                 error_list.append(repr(e))
 
                 #dummy array for visualization
-                result = (np.array(example_expected_output)*0).tolist()
+                if store_results:
+                    results.append(self._zeros_like_nested(example_expected_output))
             
-            finally:
-                results.append(result)
+            else:
+                if store_results:
+                    results.append(result)
+
+            if stop_at_first_failure and (incorrect_list or crashed_list):
+                break
 
         
         if len(correct_list) != len(task_data):
             tentative_score = 0.001
+
+        #the percent correct is unknown if some examples weren't tested.
+        num_tested_examples = len(correct_list) + len(incorrect_list) + len(crashed_list)
+        percent_correct = round(len(correct_list)/len(task_data)*100, 2) if num_tested_examples == len(task_data) else None
         
         tested_solution_dict = {
             "Score": tentative_score,
-            "Percent Correct": round(len(correct_list)/len(task_data)*100, 2),
+            "Percent Correct": percent_correct,
             "Correct Examples": correct_list,
             "Incorrect Examples": incorrect_list,
             "Crashed Examples": crashed_list,
             "Crashed Example Errors": error_list
         }
 
-        if not store_results:
-            results=[]
-
         return tested_solution_dict, results
     
+    def _outputs_match(self, result, expected_output: list) -> bool:
+        """
+        Checks if a solution's output is the same as the expected output; always agrees with np.array_equal.
+
+        A plain list comparison is much cheaper than converting both matrices to arrays, so it's tried first
+        when the output is a list of lists; it's only trusted to confirm a match, since e.g. tuple rows compare
+        unequal to list rows even though np.array_equal considers them the same.
+
+        Args:
+            result: Output of the solution function.
+            expected_output (list): Expected output of the example.
+
+        Returns:
+            bool: True if the outputs are the same.
+        """
+
+        if isinstance(result, list) and all(isinstance(row, list) for row in result):
+            try:
+                if result == expected_output:
+                    return True
+            #raised if the rows contain arrays, whose comparisons are ambiguous.
+            except ValueError:
+                pass
+
+        return np.array_equal(result, expected_output)
+    
+    def _zeros_like_nested(self, matrix: list) -> list:
+        """
+        Creates a zero-filled copy of a nested list; used to build the dummy matrices for visualization.
+
+        Args:
+            matrix (list): (Nested) list to copy the shape of.
+
+        Returns:
+            list: Nested list with the same shape as `matrix`, filled with 0.
+        """
+
+        if isinstance(matrix, list):
+            return [self._zeros_like_nested(element) for element in matrix]
+        return 0
+    
     def _create_log(self, logging_df: pd.DataFrame, correct_tasks: list, incorrect_tasks: list, crashed_tasks: list, unattempted_tasks: list):
         """
         Creates a log that specifies which tasks were correct, incorrect, and which ones crashed.
@@ -271,49 +359,57 @@ class TaskScorer:
             unattempted_tasks (list): List of tasks that were not attempted.
         """
 
-        with open(os.path.join(LOGS_DIR, "results_log.txt"), "w") as results_log:
-            results_log.write(f"====================RESULTS SUMMARY====================\n")
-            results_log.write(f"Score: {round(logging_df['Score'].sum(),3)}/{self.MAX_OVERALL_SCORE}\n")
-            results_log.write(f"Correctly solved: {len(correct_tasks)}/{self.NUM_TASKS}\n")
-            results_log.write(f"Incorrectly Solved: {len(incorrect_tasks)}/{self.NUM_TASKS}\n")
-            results_log.write(f"Program Crashed: {len(crashed_tasks)}/{self.NUM_TASKS}\n")
-            results_log.write(f"Unattempted Tasks: {len(unattempted_tasks)}/{self.NUM_TASKS}\n")
-            results_log.write("\n")
-
-            results_log.write(f"====================CORRECTLY SOLVED TASKS====================\n")
-            for task in correct_tasks:
-                results_log.write(f"{task}: {logging_df.loc[task]['Score']}/{self.MAX_TASK_SCORE}\n\n")
-            
-            results_log.write(f"====================INCORRECTLY SOLVED TASKS====================\n")
-            for task in incorrect_tasks:
-                results_log.write(f"{task}:\n")
-                results_log.write(f"\tCorrect Examples: {logging_df.loc[task]['Correct Examples']}\n")
-                results_log.write(f"\tIncorrect Examples: {logging_df.loc[task]['Incorrect Examples']}\n\n")
-            
-            results_log.write(f"====================CRASHED TASKS====================\n")
-            for task in crashed_tasks:
-                if logging_df.loc[task]["Crashed Example Errors"][0] == "--function_not_found":
-                    results_log.write(f"{task}: NameError-Function \"{SOLUTION_FUNCTION_NAME}\" not found.\n\n")
+        #the log is accumulated in memory and written with a single call.
+        log_parts = []
+        append = log_parts.append
+
+        append(f"====================RESULTS SUMMARY====================\n")
+        append(f"Score: {round(logging_df['Score'].sum(),3)}/{self.MAX_OVERALL_SCORE}\n")
+        append(f"Correctly solved: {len(correct_tasks)}/{self.NUM_TASKS}\n")
+        append(f"Incorrectly Solved: {len(incorrect_tasks)}/{self.NUM_TASKS}\n")
+        append(f"Program Crashed: {len(crashed_tasks)}/{self.NUM_TASKS}\n")
+        append(f"Unattempted Tasks: {len(unattempted_tasks)}/{self.NUM_TASKS}\n")
+        append("\n")
+
+        append(f"====================CORRECTLY SOLVED TASKS====================\n")
+        for task in correct_tasks:
+            append(f"{task}: {logging_df.at[task, 'Score']}/{self.MAX_TASK_SCORE}\n\n")
+        
+        append(f"====================INCORRECTLY SOLVED TASKS====================\n")
+        for task in incorrect_tasks:
+            task_row = logging_df.loc[task]
+            append(f"{task}:\n")
+            append(f"\tCorrect Examples: {task_row['Correct Examples']}\n")
+            append(f"\tIncorrect Examples: {task_row['Incorrect Examples']}\n\n")
+        
+        append(f"====================CRASHED TASKS====================\n")
+        for task in crashed_tasks:
+            task_row = logging_df.loc[task]
+            if task_row["Crashed Example Errors"][0] == "--function_not_found":
+                append(f"{task}: NameError-Function \"{SOLUTION_FUNCTION_NAME}\" not found.\n\n")
+            else:
+                append(f"{task}:\n")
+                append(f"\tCorrect Examples: {task_row['Correct Examples']}\n")
+                append(f"\tIncorrect Examples: {task_row['Incorrect Examples']}\n")
+                
+                if self.verbose_errors_flag:
+                    append(f"\tCrashed Examples:\n")
+
+                    crashed_tasks_i = task_row["Crashed Examples"]
+                    errors_i = task_row["Crashed Example Errors"]
+                    for j, example_j in enumerate(crashed_tasks_i):
+                        append(f"\t\t{example_j}: {errors_i[j]}\n")
                 else:
-                    results_log.write(f"{task}:\n")
-                    results_log.write(f"\tCorrect Examples: {logging_df.loc[task]['Correct Examples']}\n")
-                    results_log.write(f"\tIncorrect Examples: {logging_df.loc[task]['Incorrect Examples']}\n")
-                    
-                    if self.verbose_errors_flag:
-                        results_log.write(f"\tCrashed Examples:\n")
-
-                        crashed_tasks_i = logging_df.loc[task]["Crashed Examples"]
-                        errors_i = logging_df.loc[task]["Crashed Example Errors"]
-                        for j, example_j in enumerate(crashed_tasks_i):
-                            results_log.write(f"\t\t{example_j}: {errors_i[j]}\n")
-                    else:
-                        results_log.write(f"\tCrashed Examples: {logging_df.loc[task]['Crashed Examples']}\n")
-                    
-                    results_log.write(f"\n")
-            
-            results_log.write(f"====================UNATTEMPTED TASKS====================\n")
-            for task_i in unattempted_tasks:
-                results_log.write(f"{task_i}\n")
+                    append(f"\tCrashed Examples: {task_row['Crashed Examples']}\n")
+                
+                append(f"\n")
+        
+        append(f"====================UNATTEMPTED TASKS====================\n")
+        for task_i in unattempted_tasks:
+            append(f"{task_i}\n")
+
+        with open(os.path.join(LOGS_DIR, "results_log.txt"), "w") as results_log:
+            results_log.write("".join(log_parts))
         
         print(f"Created results log at {os.path.join(LOGS_DIR, 'results_log.txt')}")
 
@@ -321,12 +417,46 @@ class TaskScorer:
         """
         Generates an Excel sheet summarizing scores and percent correct for all tasks.
 
+        The sheet is written directly with a write-only openpyxl workbook; each score/percent cell is
+        filled with the color of the band it falls in.
+
         Args:
             logging_df (pd.DataFrame): DataFrame containing task results.
             logging_df_columns (list): Column names of logging_df.
         """
 
-        logging_df[logging_df_columns[:2]].style.apply(self._style_percent_correct, subset=["Percent Correct"]).apply(self._style_score, subset=["Score"]).to_excel(os.path.join(LOGS_DIR, "results.xlsx"))
+        header_font = Font(bold=True)
+        header_side = Side(style="thin")
+        header_border = Border(left=header_side, right=header_side, top=header_side, bottom=header_side)
+        header_alignment = Alignment(horizontal="center", vertical="top")
+
+        def header_cell(value):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            return cell
+
+        def colored_cell(value, color_ind):
+            cell = WriteOnlyCell(worksheet, value=value)
+            if color_ind >= 0:
+                cell.fill = self.EXCEL_FILLS[color_ind]
+            return cell
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Sheet1")
+
+        scores = logging_df["Score"].astype(float)
+        percents_correct = logging_df["Percent Correct"].astype(float)
+        score_color_inds = self._style_score(scores)
+        percent_correct_color_inds = self._style_percent_correct(percents_correct)
+
+        worksheet.append([None] + [header_cell(column) for column in logging_df_columns[:2]])
+        for task_name, score, score_color_ind, percent_correct, percent_correct_color_ind in zip(
+                logging_df.index, logging_df["Score"], score_color_inds, logging_df["Percent Correct"], percent_correct_color_inds):
+            worksheet.append([header_cell(task_name), colored_cell(score, score_color_ind), colored_cell(percent_correct, percent_correct_color_ind)])
+
+        workbook.save(os.path.join(LOGS_DIR, "results.xlsx"))
         print(f"Created results excel sheet at {os.path.join(LOGS_DIR, 'results.xlsx')}")
 
     def _style_percent_correct(self, percent_correct: pd.Series) -> np.ndarray:
@@ -337,12 +467,12 @@ class TaskScorer:
             percent_correct (pd.Series): The "Percent Correct" column of the results/logging dataframe.
 
         Returns:
-            np.ndarray: CSS style strings for styling Excel output.
+            np.ndarray: Index into EXCEL_FILLS of each cell's color; -1 if the cell isn't colored.
         """
 
-        score_conditions = [percent_correct<25, percent_correct<50, percent_correct<75, percent_correct<=100]
-        score_colors = ["background-color: #ff081b", "background-color: #fe8015", "background-color: #fdf709", "background-color: #87e155"]
-        return np.select(score_conditions, score_colors, default="#000000")
+        #one binary search per cell gives the band; values above the maximum (or NaN) aren't colored.
+        color_inds = np.searchsorted([25, 50, 75], percent_correct, side="right")
+        return np.where(percent_correct<=100, color_inds, -1)
 
     def _style_score(self, score: pd.Series) -> np.ndarray:
         """
@@ -352,11 +482,10 @@ class TaskScorer:
             percent_correct (pd.Series): The "Score" column of the results/logging dataframe.
 
         Returns:
-            np.ndarray: CSS style strings for styling Excel output.
+            np.ndarray: Index into EXCEL_FILLS of each cell's color; -1 if the cell isn't colored.
         """
-        score_conditions = [score<SCORE_COLOR_THRESHOLD_1, score<SCORE_COLOR_THRESHOLD_2, score<SCORE_COLOR_THRESHOLD_3, score<=2500]
-        score_colors = ["background-color: #ff081b", "background-color: #fe8015", "background-color: #fdf709", "background-color: #87e155"]
-        return np.select(score_conditions, score_colors, default="#000000")
+        color_inds = np.searchsorted([SCORE_COLOR_THRESHOLD_1, SCORE_COLOR_THRESHOLD_2, SCORE_COLOR_THRESHOLD_3], score, side="right")
+        return np.where(score<=self.MAX_TASK_SCORE, color_inds, -1)
     
     def _create_single_log(self, task_name: str, task_results_dict: dict):
         """
@@ -368,19 +497,26 @@ class TaskScorer:
         """
 
         num_total_examples = len(task_results_dict["Correct Examples"]) + len(task_results_dict["Incorrect Examples"]) + len(task_results_dict["Crashed Examples"])
-        print(f"===================={task_name.upper()} RESULTS SUMMARY====================")
-        print(f"Score: {task_results_dict['Score']}/{self.MAX_TASK_SCORE}\n")
-        print(f"Percent Correct: {task_results_dict['Percent Correct']}\n")
-        print(f"Correctly solved: {len(task_results_dict['Correct Examples'])}/{num_total_examples}")
-        print(f"\t- {task_results_dict['Correct Examples']}\n")
-        print(f"Inorrectly solved: {len(task_results_dict['Incorrect Examples'])}/{num_total_examples}")
-        print(f"\t- {task_results_dict['Incorrect Examples']}\n")
-        print(f"Crashed: {len(task_results_dict['Crashed Examples'])}/{num_total_examples}")
+
+        #the lines are printed together with a single write.
+        log_lines = []
+        append = log_lines.append
+
+        append(f"===================={task_name.upper()} RESULTS SUMMARY====================")
+        append(f"Score: {task_results_dict['Score']}/{self.MAX_TASK_SCORE}\n")
+        append(f"Percent Correct: {task_results_dict['Percent Correct']}\n")
+        append(f"Correctly solved: {len(task_results_dict['Correct Examples'])}/{num_total_examples}")
+        append(f"\t- {task_results_dict['Correct Examples']}\n")
+        append(f"Inorrectly solved: {len(task_results_dict['Incorrect Examples'])}/{num_total_examples}")
+        append(f"\t- {task_results_dict['Incorrect Examples']}\n")
+        append(f"Crashed: {len(task_results_dict['Crashed Examples'])}/{num_total_examples}")
         if self.verbose_errors_flag:
             for i, example_i in enumerate(task_results_dict['Crashed Examples']):
-                print(f"\t- {example_i}: {task_results_dict['Crashed Example Errors'][i]}")
+                append(f"\t- {example_i}: {task_results_dict['Crashed Example Errors'][i]}")
         else:
-            print(f"\t- {task_results_dict['Crashed Examples']}\n")
+            append(f"\t- {task_results_dict['Crashed Examples']}\n")
+
+        sys.stdout.write("\n".join(log_lines) + "\n")
 
     
     #=====Entry Point=====
@@ -397,8 +533,8 @@ class TaskScorer:
             self._score_log_single_task(f"task{self.task_num.zfill(3)}")
 
 if __name__ == "__main__":
-    task_num, verbose_errors_flag = parse_logging_args()
+    task_num, verbose_errors_flag, fast_flag = parse_logging_args()
 
-    TS_i = TaskScorer(task_num, verbose_errors_flag)
+    TS_i = TaskScorer(task_num, verbose_errors_flag, fast_flag)
 
     TS_i.score()
\ No newline at end of file
@@ -1,13 +1,35 @@
 """
-Utility functions for parsing CLI arguments and loading task data.
+Utility functions for parsing CLI arguments and loading task data and solutions.
 """
 
 import os
 import json
 import argparse
-from typing import Tuple
+import functools
+import importlib.util
+from types import ModuleType
+from typing import Tuple, Optional
 
-from config import DATA_DIR
+import numpy as np
+
+from config import DATA_DIR, SOLUTION_DIR, USE_TASK_BUNDLE
+
+#orjson is optional; it parses the task files much faster than the json module when it's installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+#pyarrow is optional; it's only needed to create (bundle_task_data.py) and read the task bundle.
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+#single file holding the examples of every task in DATA_DIR; created by bundle_task_data.py.
+TASK_BUNDLE_PATH = os.path.join(DATA_DIR, "tasks.feather")
+TASK_SPLITS = ("train", "test", "arc-gen")
 
 def parse_visualization_args() -> str:
     """
@@ -22,18 +44,19 @@ def parse_visualization_args() -> str:
 
     return parser.parse_args().task_num
 
-def parse_logging_args() -> Tuple[str, bool]:
+def parse_logging_args() -> Tuple[str, bool, bool]:
     """
     Parses command line arguments for score_task.py.
 
     Returns:
-        Tuple[str, bool]: Task number and verbosity flag.
+        Tuple[str, bool, bool]: Task number, verbosity flag, and fast flag.
     """
 
     parser = argparse.ArgumentParser(description="Visualize tasks with interactive plots.")
     parser.add_argument("task_num", type=_validate_task_num, help="Task number from 1 to 400 (e.g. 1 for task001)", nargs="?")
     parser.add_argument("-a", "--all_tasks", action="store_true", help="If this flag is set, all tasks will be scored and result logs will be created.")
     parser.add_argument("-v", "--verbose", action="store_true", help="If this flag is set, the logs won't display the error caused by each example that crashed.")
+    parser.add_argument("-f", "--fast", action="store_true", help="If this flag is set, when scoring all tasks each solution is only tested until its first incorrect or crashed example; failing tasks are categorized by that example.")
 
     args = parser.parse_args()
 
@@ -41,7 +64,7 @@ def parse_logging_args() -> Tuple[str, bool]:
     # If arg.task_num is not given and --all_tasks is not set, task_num is set to 0.
     task_num = "0" if (args.all_tasks or (args.task_num is None)) else args.task_num
 
-    return task_num, args.verbose
+    return task_num, args.verbose, args.fast
 
 def _validate_task_num(task_num: str) -> str:
     """
@@ -51,23 +74,111 @@ def _validate_task_num(task_num: str) -> str:
         str: Task number.
     """
 
-    if (not task_num.isdigit()) or (int(task_num)>400) or (int(task_num)<1):
-        raise argparse.ArgumentTypeError(f"\"{task_num}\" is not a valid task number; you must input an integer from 1 to 400")
+    error_message = f"\"{task_num}\" is not a valid task number; you must input an integer from 1 to 400"
+
+    # isdigit rejects inputs like "+5", " 5", and "1_0" that int would otherwise accept.
+    if not task_num.isdigit():
+        raise argparse.ArgumentTypeError(error_message)
+
+    try:
+        task_num_int = int(task_num)
+    except ValueError:
+        raise argparse.ArgumentTypeError(error_message)
+
+    if not 1 <= task_num_int <= 400:
+        raise argparse.ArgumentTypeError(error_message)
     
     # Converted back to string to avoid conflicts and to strip extra zeroes; the necessary amount of zerous is already
     # added later.
-    return str(int(task_num))
+    return str(task_num_int)
 
+#only the most recent task is kept; it's reused when a task is scored and then visualized.
+@functools.lru_cache(maxsize=1)
 def load_task_data(task_name: str) -> list:
     """
     Loads and merges all the examples/data of a specified task.
 
-    Each task is expected to be a JSON object with keys "train", "test, and "arc-gen".
+    If USE_TASK_BUNDLE is True (in the config), the examples are read from the task bundle (TASK_BUNDLE_PATH)
+    when it contains the task and the task's JSON file hasn't been modified since the bundle was created;
+    otherwise they're read from the task's JSON file. The most recently loaded task is cached, so loading
+    it again returns the same list.
 
     Returns:
         list: Combined list of all examples in the specified task.
     """
 
-    with open (os.path.join(DATA_DIR, f"{task_name}.json"), "r") as task_file:
-        task_json = json.load(task_file)
-    return task_json["train"] + task_json["test"] + task_json["arc-gen"]
+    task_bundle = _load_task_bundle() if USE_TASK_BUNDLE else None
+    if (task_bundle is not None) and (task_name in task_bundle[2]):
+        bundle_table, bundle_mtime, task_rows = task_bundle
+        task_path = os.path.join(DATA_DIR, f"{task_name}.json")
+
+        if (not os.path.isfile(task_path)) or (os.stat(task_path).st_mtime <= bundle_mtime):
+            row_i = task_rows[task_name]
+            matrix_shapes = bundle_table.column("matrix_shapes")[row_i].values.to_numpy()
+            matrix_values = np.frombuffer(bundle_table.column("matrix_values")[row_i].as_buffer(), dtype=np.uint8)
+
+            #each example's input and output are stored one after the other, as flattened matrices.
+            matrices = []
+            matrix_start = 0
+            for num_rows, num_cols in matrix_shapes.reshape(-1, 2).tolist():
+                matrix_end = matrix_start + num_rows*num_cols
+                matrices.append(matrix_values[matrix_start:matrix_end].reshape(num_rows, num_cols).tolist())
+                matrix_start = matrix_end
+
+            return [{"input": matrices[i], "output": matrices[i+1]} for i in range(0, len(matrices), 2)]
+
+    task_json = load_task_json(task_name)
+    return [example_i for split in TASK_SPLITS for example_i in task_json[split]]
+
+def load_task_json(task_name: str) -> dict:
+    """
+    Loads the JSON file of a specified task.
+
+    Each task is expected to be a JSON object with keys "train", "test, and "arc-gen".
+
+    Returns:
+        dict: The task's JSON object.
+    """
+
+    with open (os.path.join(DATA_DIR, f"{task_name}.json"), "rb") as task_file:
+        return _json_loads(task_file.read())
+
+@functools.lru_cache(maxsize=None)
+def _load_task_bundle() -> Optional[Tuple["pyarrow.Table", float, dict]]:
+    """
+    Memory maps the task bundle and finds the row of each task.
+
+    Returns:
+        Tuple[pyarrow.Table, float, dict] or None: The bundle table, its modification time, and a dictionary
+        mapping each task name to its row; None if the bundle or pyarrow isn't available.
+    """
+
+    if (feather is None) or (not os.path.isfile(TASK_BUNDLE_PATH)):
+        return None
+
+    bundle_mtime = os.stat(TASK_BUNDLE_PATH).st_mtime
+    bundle_table = feather.read_table(TASK_BUNDLE_PATH, memory_map=True)
+    task_rows = {task_name: row_i for row_i, task_name in enumerate(bundle_table.column("task_name").to_pylist())}
+
+    return bundle_table, bundle_mtime, task_rows
+
+@functools.lru_cache(maxsize=None)
+def load_solution_module(task_name: str) -> Tuple[ModuleType, int]:
+    """
+    Loads the solution file of a specified task as a module.
+
+    The module is loaded directly from its path in SOLUTION_DIR and cached, so repeated calls for the same
+    task don't load it again.
+
+    Returns:
+        Tuple[ModuleType, int]: The loaded solution module and the size of the solution file in bytes.
+    """
+
+    solution_path = os.path.join(SOLUTION_DIR, f"{task_name}.py")
+    solution_size = os.stat(solution_path).st_size
+
+    spec = importlib.util.spec_from_file_location(task_name, solution_path)
+    solution_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(solution_module)
+
+    return solution_module, solution_size
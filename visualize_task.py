@@ -24,6 +24,7 @@ class TaskVisualizer:
         CMAP_NORM (matplotlib.colors.BoundaryNorm): Helper object to enforce CMAP's color mapping.
         LEGEND_HANDLES (list): List of colored patches used to show the color mapping in the legend.
         LEGEND_LABELS (list): Strings of the possible numbers to use in the legend.
+        TEXT_SETTINGS (dict): Settings used to create the (initially hidden) number overlay text.
 
         task_name (str): Task identifier; e.g. `"task001"`.
         solution_results (list or None): List of solution outputs.
@@ -33,6 +34,7 @@ class TaskVisualizer:
     CMAP_NORM = BoundaryNorm(np.arange(-0.5, 10.5, 1), CMAP.N)
     LEGEND_HANDLES = [mpatches.Patch(color=COLOR_DICT[i]) for i in range(10)]
     LEGEND_LABELS = [str(i) for i in range(10)]
+    TEXT_SETTINGS = {**PLOT_TEXT_SETTINGS, "visible": False}
 
     def __init__(self, task_name: str, solution_results: Optional[list]=None):
         """
@@ -56,6 +58,7 @@ class TaskVisualizer:
         self.fig.legend(handles=self.LEGEND_HANDLES, labels=self.LEGEND_LABELS, loc="upper right")
 
         self._init_widgets()
+        self._init_plots()
 
         self._plot_example()
     
@@ -89,42 +92,133 @@ class TaskVisualizer:
         self.next_button = Button(ax_next, "Next")
         self.next_button.on_clicked(self._next_example)
     
+    def _init_plots(self):
+        """
+        Creates the image shown in each subplot; it's reused (along with the number overlay) on every redraw.
+        """
+
+        self._images = []
+        #matrix currently shown in each subplot.
+        self._matrices = []
+        #2D grid of number overlay text artists for each subplot, sized to the largest matrix numbered so far.
+        self._text_artists = []
+        #the text artists currently showing the numbers of each subplot's matrix.
+        self._shown_text_artists = []
+
+        for axis in self.axes:
+            self._images.append(axis.imshow([[0]], cmap=self.CMAP, norm=self.CMAP_NORM, interpolation="nearest"))
+            self._matrices.append(None)
+            self._text_artists.append([])
+            self._shown_text_artists.append([])
+
+            axis.set_xticks([])
+            axis.set_yticks([])
+    
     def _plot_example(self):
         """
         Plot the current example's input, output, and (optionally) solution.
         """
 
-        self._plot_matrix(self.axes[0], self.task_data[self.current_example_ind]["input"], "Input")
-        self._plot_matrix(self.axes[1], self.task_data[self.current_example_ind]["output"], "Output")
+        self._plot_matrix(0, self.task_data[self.current_example_ind]["input"], "Input")
+        self._plot_matrix(1, self.task_data[self.current_example_ind]["output"], "Output")
 
         if self.solution_results:
-            self._plot_matrix(self.axes[2], self.solution_results[self.current_example_ind], "Result")
+            self._plot_matrix(2, self.solution_results[self.current_example_ind], "Result")
         
         self.fig.canvas.draw_idle()
 
-    def _plot_matrix(self, axis: plt.Axes, matrix: list, title: str):
+    def _plot_matrix(self, axis_ind: int, matrix: list, title: str):
         """
         Plot a specified matrix.
 
+        The subplot's image and number overlay are updated in place rather than redrawn from scratch.
+
         Attributes:
-            axis (plt.Axes): Axis (subplot) to draw the matrix on.
+            axis_ind (int): Index of the axis (subplot) to draw the matrix on.
             matrix (list): Matrix to draw.
             title (str): Title of the subplot.
         """
 
-        axis.cla()
-        matrix = np.array(matrix, dtype=np.uint8)
-        axis.matshow(matrix, cmap=self.CMAP, norm=self.CMAP_NORM)
+        axis = self.axes[axis_ind]
+        #matplotlib converts the matrix itself, so its shape is taken from the list directly.
+        num_rows = len(matrix)
+        num_cols = len(matrix[0]) if num_rows > 0 else 0
+
+        image = self._images[axis_ind]
+        image.set_data(matrix)
+        image.set_extent((-0.5, num_cols - 0.5, num_rows - 0.5, -0.5))
 
-        #overlay numbers inside each cell if True.
+        self._matrices[axis_ind] = matrix
+
+        #overlay numbers inside each cell if True; otherwise the text artists are left untouched.
+        self._hide_numbers(axis_ind)
         if self.show_numbers:
-            for (i, j), val in np.ndenumerate(matrix):
-                axis.text(j, i, val, **PLOT_TEXT_SETTINGS)
+            self._show_numbers(axis_ind)
 
         axis.set_title(title)
-        axis.set_xlabel(f"{matrix.shape}")
-        axis.set_xticks([])
-        axis.set_yticks([])
+        axis.set_xlabel(f"({num_rows}, {num_cols})")
+
+    def _show_numbers(self, axis_ind: int):
+        """
+        Overlays the numbers of the matrix currently shown in a subplot.
+
+        Attributes:
+            axis_ind (int): Index of the axis (subplot) to overlay the numbers on.
+        """
+
+        matrix = self._matrices[axis_ind]
+        num_rows = len(matrix)
+        num_cols = len(matrix[0]) if num_rows > 0 else 0
+        text_artists = self._get_text_artists(axis_ind, num_rows, num_cols)
+
+        shown_text_artists = []
+        for i, row in enumerate(matrix):
+            for j, val in enumerate(row):
+                text_artist = text_artists[i][j]
+                text_artist.set_text(str(val))
+                text_artist.set_visible(True)
+                shown_text_artists.append(text_artist)
+        self._shown_text_artists[axis_ind] = shown_text_artists
+
+    def _hide_numbers(self, axis_ind: int):
+        """
+        Hides the numbers overlaid on a subplot.
+
+        Attributes:
+            axis_ind (int): Index of the axis (subplot) to hide the numbers of.
+        """
+
+        for text_artist in self._shown_text_artists[axis_ind]:
+            text_artist.set_visible(False)
+        self._shown_text_artists[axis_ind] = []
+
+    def _get_text_artists(self, axis_ind: int, num_rows: int, num_cols: int) -> list:
+        """
+        Gets the number overlay text artists of a subplot, creating new ones if the matrix is larger than any shown before.
+
+        Attributes:
+            axis_ind (int): Index of the axis (subplot) the text artists belong to.
+            num_rows (int): Number of rows in the matrix to overlay.
+            num_cols (int): Number of columns in the matrix to overlay.
+
+        Returns:
+            list: 2D list of text artists with at least `num_rows` rows and `num_cols` columns.
+        """
+
+        text_artists = self._text_artists[axis_ind]
+
+        #bound once since a large grid creates hundreds of text artists at a time.
+        create_text = self.axes[axis_ind].text
+        text_settings = self.TEXT_SETTINGS
+
+        num_cols = max(num_cols, len(text_artists[0]) if text_artists else 0)
+        for i, text_artists_row in enumerate(text_artists):
+            for j in range(len(text_artists_row), num_cols):
+                text_artists_row.append(create_text(j, i, "", **text_settings))
+        for i in range(len(text_artists), num_rows):
+            text_artists.append([create_text(j, i, "", **text_settings) for j in range(num_cols)])
+
+        return text_artists
     
     #=====Event Handlers=====
 
@@ -168,7 +262,17 @@ class TaskVisualizer:
         """
 
         self.show_numbers = not self.show_numbers
-        self._plot_example()
+
+        #only the number overlay changes, so the matrices don't need to be replotted.
+        for axis_ind, matrix in enumerate(self._matrices):
+            if matrix is None:
+                continue
+
+            if self.show_numbers:
+                self._show_numbers(axis_ind)
+            else:
+                self._hide_numbers(axis_ind)
+        self.fig.canvas.draw_idle()
 
     def _text_submitted(self, val: str):
         """